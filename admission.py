@@ -0,0 +1,173 @@
+"""
+Admission control for the heavy endpoints.
+
+Each pool (e.g. 'ocr', 'scrape') combines:
+  - a per-client token bucket (rate tokens/second, up to burst) that limits how
+    often one client may start requests -> 429 when empty
+  - a per-client and a global cap on requests in flight; a request waits up to
+    queue_timeout seconds for a free slot -> 503 when none frees up
+
+Rejections carry a Retry-After header so scripts can back off, and waiting is
+bounded, which keeps tail latency predictable for interactive users.
+
+Pools are configured through app.config['ADMISSION_POOLS'] and views opt in
+with @limit('<pool>'). Setting app.config['ADMISSION_ENABLED'] = False turns
+every limit into a pass-through.
+"""
+from flask import current_app, jsonify, make_response, request
+from collections import OrderedDict
+import functools
+import logging
+import math
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Buckets kept per pool; beyond this the least recently seen client is forgotten
+# (it simply starts again with a full bucket)
+MAX_TRACKED_CLIENTS = 10000
+
+
+class TokenBucket:
+    def __init__(self, rate, burst, now):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = now
+
+    def refill(self, now):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def take(self, now):
+        """Consume one token; returns 0 on success, else seconds until one is available"""
+        self.refill(now)
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def give_back(self):
+        self.tokens = min(self.burst, self.tokens + 1)
+
+class AdmissionPool:
+    """Token buckets plus in-flight caps for one group of endpoints"""
+
+    def __init__(self, name, rate, burst, max_in_flight, max_in_flight_per_client=None,
+                 queue_timeout=0.0, busy_retry_after=5):
+        if rate <= 0:
+            raise ValueError(f"Admission pool '{name}': rate must be > 0 (got {rate})")
+        if burst < 1:
+            raise ValueError(f"Admission pool '{name}': burst must be >= 1 (got {burst})")
+        if max_in_flight < 1:
+            raise ValueError(f"Admission pool '{name}': max_in_flight must be >= 1 (got {max_in_flight})")
+        if max_in_flight_per_client is not None and max_in_flight_per_client < 0:
+            raise ValueError(f"Admission pool '{name}': max_in_flight_per_client must be >= 0 "
+                             f"(got {max_in_flight_per_client}; 0 means no separate per-client cap)")
+        self.name = name
+        self.rate = rate
+        self.burst = burst
+        self.max_in_flight = max_in_flight
+        self.max_in_flight_per_client = max_in_flight_per_client or max_in_flight
+        self.queue_timeout = queue_timeout
+        self.busy_retry_after = busy_retry_after
+        self.buckets = OrderedDict()  # least recently seen client first
+        self.client_in_flight = {}
+        self.in_flight = 0
+        self.cond = threading.Condition()
+
+    def _bucket(self, client, now):
+        bucket = self.buckets.get(client)
+        if bucket is None:
+            if len(self.buckets) >= MAX_TRACKED_CLIENTS:
+                self.buckets.popitem(last=False)  # O(1), so a flood of new addresses stays cheap
+            bucket = self.buckets[client] = TokenBucket(self.rate, self.burst, now)
+        else:
+            self.buckets.move_to_end(client)
+        return bucket
+
+    def acquire(self, client):
+        """
+        Try to admit a request from client.
+        Returns (True, None) when admitted (call release() when done) or
+        (False, (status, message, retry_after_seconds)) when rejected.
+        """
+        with self.cond:
+            now = time.monotonic()
+            bucket = self._bucket(client, now)
+            wait = bucket.take(now)
+            if wait:
+                return False, (429, 'Too many requests. Please slow down and try again shortly.', wait)
+
+            deadline = now + self.queue_timeout
+            while (self.in_flight >= self.max_in_flight or
+                   self.client_in_flight.get(client, 0) >= self.max_in_flight_per_client):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    bucket.give_back()  # not the client's fault, don't charge for it
+                    return False, (503, 'Server is busy processing other requests. Please try again shortly.',
+                                   self.busy_retry_after)
+                self.cond.wait(remaining)
+
+            self.in_flight += 1
+            self.client_in_flight[client] = self.client_in_flight.get(client, 0) + 1
+            return True, None
+
+    def release(self, client):
+        with self.cond:
+            self.in_flight -= 1
+            remaining = self.client_in_flight.get(client, 1) - 1
+            if remaining:
+                self.client_in_flight[client] = remaining
+            else:
+                self.client_in_flight.pop(client, None)
+            self.cond.notify_all()
+
+
+def init_app(app):
+    """Build the pools described in app.config['ADMISSION_POOLS']"""
+    pools = {name: AdmissionPool(name, **settings)
+             for name, settings in app.config.get('ADMISSION_POOLS', {}).items()}
+    app.extensions['admission'] = pools
+    for pool in pools.values():
+        logger.info(f"Admission pool '{pool.name}': {pool.rate}/s per client (burst {pool.burst}), "
+                    f"max {pool.max_in_flight} in flight ({pool.max_in_flight_per_client} per client)")
+
+def client_id():
+    """Identify the caller; behind a reverse proxy wrap the app in werkzeug's ProxyFix"""
+    return request.remote_addr or 'unknown'
+
+def limit(pool_name):
+    """Decorator: admit the view through the named pool or answer 429/503 with Retry-After"""
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapped(*args, **kwargs):
+            pool = current_app.extensions.get('admission', {}).get(pool_name)
+            if pool is None or not current_app.config.get('ADMISSION_ENABLED', True):
+                return view(*args, **kwargs)
+
+            client = client_id()
+            admitted, rejection = pool.acquire(client)
+            if not admitted:
+                status, message, retry_after = rejection
+                retry_after = max(1, math.ceil(retry_after))
+                logger.warning(f"Rejected {request.path} from {client} ({status}), retry after {retry_after}s")
+                response = jsonify({'success': False, 'error': message, 'retry_after': retry_after})
+                response.status_code = status
+                response.headers['Retry-After'] = str(retry_after)
+                return response
+
+            try:
+                response = make_response(view(*args, **kwargs))
+            except BaseException:
+                pool.release(client)
+                raise
+            if response.is_streamed:
+                # Hold the slot until the streamed body has been sent
+                response.call_on_close(lambda: pool.release(client))
+            else:
+                pool.release(client)
+            return response
+        return wrapped
+    return decorator
@@ -0,0 +1,56 @@
+"""
+Analyst1 - OCR Text Extraction
+
+Tesseract and Pillow are only imported (via get_ocr()) when the first
+image is submitted.
+"""
+from flask import Blueprint, current_app, render_template, request, jsonify
+from admission import limit
+
+bp = Blueprint('analyst1', __name__, url_prefix='/analyst1')
+
+
+def get_ocr():
+    """Import the OCR backend on first use"""
+    from . import ocr
+    return ocr
+
+
+@bp.route('')
+def index():
+    return render_template('analyst1/index.html', ocr_upload=current_app.config.get('OCR_UPLOAD', {}))
+
+@bp.route('/extract-text', methods=['POST'])
+@limit('ocr')
+def extract_text():
+    try:
+        ocr = get_ocr()
+        
+        # Raw image bodies (what the page sends) skip the base64 round trip;
+        # JSON {"image": "<data URL or base64>"} is still accepted
+        if request.mimetype.startswith('image/') or request.mimetype == 'application/octet-stream':
+            image_bytes = request.get_data()
+            if not image_bytes:
+                return jsonify({'error': 'No image data provided'}), 400
+            image = ocr.open_image(image_bytes)
+        else:
+            data = request.get_json(silent=True)
+            
+            if not data or 'image' not in data:
+                return jsonify({'error': 'No image data provided'}), 400
+            
+            image = ocr.decode_image(data['image'])
+        
+        # Perform OCR
+        extracted_text = ocr.image_to_text(image)
+        
+        return jsonify({
+            'success': True,
+            'text': extracted_text
+        })
+    
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
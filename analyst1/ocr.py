@@ -0,0 +1,35 @@
+"""
+Tesseract OCR backend for Analyst1.
+
+Imported on the first extraction request so nodes that never serve OCR
+do not load pytesseract or Pillow.
+"""
+import pytesseract
+from PIL import Image
+import io
+import base64
+import os
+
+# Configure Tesseract path (only if not in Docker/standard location)
+# In Docker, Tesseract is in the standard PATH, so we only set this if needed
+if os.path.exists('/opt/homebrew/bin/tesseract'):
+    pytesseract.pytesseract.tesseract_cmd = '/opt/homebrew/bin/tesseract'
+# Docker/standard Linux installation will use the default PATH
+
+
+def open_image(image_bytes):
+    """Open raw encoded image bytes (PNG, JPEG, ...) as a PIL image"""
+    return Image.open(io.BytesIO(image_bytes))
+
+def decode_image(image_data):
+    """Decode a base64 string or data URL into a PIL image"""
+    # Remove data URL prefix if present (e.g., "data:image/png;base64,")
+    if ',' in image_data:
+        image_data = image_data.split(',')[1]
+    
+    # Decode base64 image
+    return open_image(base64.b64decode(image_data))
+
+def image_to_text(image):
+    """Run Tesseract over a PIL image and return the extracted text"""
+    return pytesseract.image_to_string(image)
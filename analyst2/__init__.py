@@ -0,0 +1,209 @@
+"""
+Analyst2 - LinkedIn Employee Count Scraper
+
+The Selenium scraper lives in analyst2.scraper and is imported lazily by
+get_scraper(), so registering this blueprint does not load the browser stack.
+"""
+from flask import Blueprint, Response, render_template, request, jsonify, stream_with_context
+from admission import limit
+from .batch import clean_url, detect_format, invalid_result, iter_input_urls, iter_output, MIMETYPES
+import time
+import logging
+import shutil
+import tempfile
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+bp = Blueprint('analyst2', __name__, url_prefix='/analyst2')
+
+
+def get_scraper():
+    """Import the Selenium-backed scraper on first use"""
+    from . import scraper
+    return scraper
+
+
+def _init_scraper():
+    """Load the scraper and start the browser; returns (scraper, None) or (None, error response)"""
+    # Get driver (first request also pays for importing Selenium)
+    driver_init_start = time.time()
+    try:
+        logger.info("Initializing Chrome driver...")
+        scraper = get_scraper()
+        scraper.get_driver()
+        driver_init_elapsed = time.time() - driver_init_start
+        logger.info(f"Driver initialized in {driver_init_elapsed:.2f} seconds")
+        return scraper, None
+    except Exception as e:
+        driver_init_elapsed = time.time() - driver_init_start
+        error_msg = str(e)
+        logger.error(f"Driver initialization failed after {driver_init_elapsed:.2f} seconds: {error_msg}")
+        if 'ChromeDriverManager' in error_msg or 'timeout' in error_msg.lower():
+            error_msg = 'Chrome driver initialization is taking too long. This may happen on first run when downloading ChromeDriver. Please wait and try again, or ensure you have a stable internet connection.'
+        return None, (jsonify({
+            'success': False,
+            'error': f'Failed to initialize browser: {error_msg}. Make sure Chrome is installed.'
+        }), 500)
+
+
+@bp.route('')
+def index():
+    return render_template('analyst2/index.html')
+
+@bp.route('/scrape-linkedin', methods=['POST'])
+@limit('scrape')
+def scrape_linkedin():
+    request_start_time = time.time()
+    logger.info("=" * 80)
+    logger.info(f"New scrape request received at {datetime.now().isoformat()}")
+    
+    try:
+        data = request.get_json()
+        
+        if not data or 'urls' not in data:
+            logger.error("No URLs provided in request")
+            return jsonify({'success': False, 'error': 'No URLs provided'}), 400
+        
+        urls = data['urls']
+        logger.info(f"Received {len(urls)} URLs to process")
+        
+        if not isinstance(urls, list):
+            logger.error(f"URLs is not a list: {type(urls)}")
+            return jsonify({'success': False, 'error': 'URLs must be a list'}), 400
+        
+        if not urls:
+            logger.error("URL list is empty")
+            return jsonify({'success': False, 'error': 'URL list cannot be empty'}), 400
+        
+        # Clean and validate URLs
+        cleaned_urls = []
+        for url in urls:
+            cleaned = clean_url(url)
+            if cleaned is None:
+                if isinstance(url, str) and url.strip():
+                    logger.warning(f"Skipping invalid URL (not a LinkedIn company URL): {url}")
+                continue
+            cleaned_urls.append(cleaned)
+        
+        logger.info(f"After validation: {len(cleaned_urls)} valid URLs to process")
+        if not cleaned_urls:
+            logger.error("No valid LinkedIn company URLs after validation")
+            return jsonify({'success': False, 'error': 'No valid LinkedIn company URLs provided'}), 400
+        
+        scraper, error_response = _init_scraper()
+        if error_response is not None:
+            return error_response
+        
+        # Scrape each URL with timeout protection
+        results = []
+        scraping_start_time = time.time()
+        logger.info(f"Starting to scrape {len(cleaned_urls)} URLs...")
+        try:
+            results = list(scraper.scrape_urls(cleaned_urls))
+        finally:
+            # Clean up driver if needed (but keep it for reuse)
+            scraping_elapsed = time.time() - scraping_start_time
+            logger.info(f"Completed scraping all URLs in {scraping_elapsed:.2f} seconds")
+        
+        total_request_time = time.time() - request_start_time
+        successful = sum(1 for r in results if r.get('error') is None)
+        failed = len(results) - successful
+        logger.info(f"Request completed in {total_request_time:.2f} seconds: {successful} successful, {failed} failed")
+        logger.info("=" * 80)
+        
+        return jsonify({
+            'success': True,
+            'results': results
+        })
+    
+    except Exception as e:
+        total_request_time = time.time() - request_start_time
+        logger.error(f"Fatal error in scrape_linkedin after {total_request_time:.2f} seconds: {str(e)}", exc_info=True)
+        return jsonify({
+            'success': False,
+            'error': f'Server error: {str(e)}'
+        }), 500
+
+
+@bp.route('/scrape-linkedin/bulk', methods=['POST'])
+@limit('scrape')
+def scrape_linkedin_bulk():
+    """
+    Bulk mode: take a CSV or NDJSON file of company URLs and stream the results
+    back as a CSV or NDJSON download, one row per input row, as each URL finishes.
+
+    Accepts a multipart upload (field "file") or the file as the raw request body.
+    Optional "format" (input) and "output" parameters override format detection;
+    for raw bodies they must be given in the query string.
+    """
+    # Only touch request.files / request.values for multipart uploads: for any other
+    # form content type Werkzeug would parse (and use up) the raw body as a form
+    if request.mimetype == 'multipart/form-data':
+        upload = request.files.get('file')
+        if upload is None or not upload.filename:
+            return jsonify({'success': False, 'error': 'No file provided'}), 400
+        # Werkzeug spools large uploads to a temporary file
+        source = upload.stream
+        options = request.values
+        input_format = detect_format(upload.filename, upload.mimetype, options.get('format'))
+    elif request.mimetype == 'application/x-www-form-urlencoded':
+        # What `curl --data-binary` sends unless told otherwise
+        logger.error("Bulk upload sent as a form-encoded body")
+        return jsonify({
+            'success': False,
+            'error': 'Send the file as a multipart upload (field "file") or as a raw body with '
+                     'Content-Type text/csv or application/x-ndjson'
+        }), 415
+    elif request.content_length:
+        # Spool the raw body to disk so rows can be read lazily while the response streams
+        source = tempfile.TemporaryFile()
+        shutil.copyfileobj(request.stream, source)
+        source.seek(0)
+        options = request.args
+        input_format = detect_format(mimetype=request.mimetype, requested=options.get('format'))
+    else:
+        return jsonify({'success': False, 'error': 'No file provided'}), 400
+    
+    output_format = detect_format(requested=options.get('output') or input_format)
+    
+    scraper, error_response = _init_scraper()
+    if error_response is not None:
+        source.close()
+        return error_response
+    
+    def generate():
+        request_start_time = time.time()
+        rows = scraped = failed = 0
+        logger.info("=" * 80)
+        logger.info(f"Bulk scrape started at {datetime.now().isoformat()} ({input_format} -> {output_format})")
+        try:
+            for raw, candidate in iter_input_urls(source, input_format):
+                rows += 1
+                url = clean_url(candidate)
+                if url is None:
+                    logger.warning(f"Skipping invalid URL (not a LinkedIn company URL): {raw}")
+                    failed += 1
+                    yield invalid_result(raw)
+                    continue
+                if scraped:
+                    scraper.pause_between_urls()
+                scraped += 1
+                result = scraper.scrape_url(url, f"bulk {rows}")
+                if result.get('error'):
+                    failed += 1
+                yield result
+        finally:
+            source.close()
+            total_request_time = time.time() - request_start_time
+            logger.info(f"Bulk scrape finished in {total_request_time:.2f} seconds: {rows} rows, "
+                        f"{scraped} scraped, {failed} failed")
+            logger.info("=" * 80)
+    
+    filename = f"linkedin_employee_counts_{datetime.now().strftime('%Y-%m-%d')}.{output_format}"
+    response = Response(stream_with_context(iter_output(generate(), output_format)),
+                        mimetype=MIMETYPES[output_format])
+    response.headers['Content-Disposition'] = f'attachment; filename="{filename}"'
+    # Ask reverse proxies not to buffer, so rows reach the client as they finish
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
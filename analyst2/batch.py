@@ -0,0 +1,140 @@
+"""
+Bulk input and streamed output for Analyst2 scrape batches.
+
+Uploaded CSV / NDJSON files are read row by row and results are written one
+line at a time, so memory use does not depend on the size of the batch.
+"""
+import csv
+import io
+import json
+import os
+from urllib.parse import urlsplit
+
+FORMATS = ('csv', 'ndjson')
+
+# Header names (lower-cased) recognised as the URL column in CSV uploads
+URL_COLUMNS = ('url', 'linkedin url', 'linkedin_url', 'company url', 'company_url', 'linkedin')
+# Keys recognised as the URL in NDJSON objects
+URL_KEYS = ('url', 'linkedin_url', 'company_url')
+
+CSV_HEADER = ['LinkedIn URL', 'Employee Count', 'Status']
+MIMETYPES = {'csv': 'text/csv', 'ndjson': 'application/x-ndjson'}
+
+INVALID_URL_ERROR = 'Not a LinkedIn company URL'
+
+
+def clean_url(url):
+    """Normalize a LinkedIn company URL, or return None if it is not one"""
+    if not isinstance(url, str):
+        return None
+    url = url.strip()
+    if not url or any(ch.isspace() for ch in url):
+        return None
+    if not url.startswith(('http://', 'https://')):
+        url = 'https://' + url
+    try:
+        parts = urlsplit(url)
+        host = parts.hostname or ''
+    except ValueError:
+        return None
+    # Ensure it's a LinkedIn company URL: linkedin.com host, /company/<slug> path
+    if host != 'linkedin.com' and not host.endswith('.linkedin.com'):
+        return None
+    segments = [segment for segment in parts.path.split('/') if segment]
+    if len(segments) < 2 or segments[0] != 'company':
+        return None
+    return url
+
+def detect_format(filename=None, mimetype=None, requested=None):
+    """Pick 'csv' or 'ndjson' from an explicit choice, the file extension or the mimetype"""
+    if requested in FORMATS:
+        return requested
+    ext = os.path.splitext(filename or '')[1].lower()
+    if ext in ('.ndjson', '.jsonl') or (mimetype or '').endswith(('ndjson', 'jsonlines', 'json-seq')):
+        return 'ndjson'
+    return 'csv'
+
+def iter_input_urls(binary_stream, fmt):
+    """
+    Yield (raw, candidate) for every data row in a CSV or NDJSON byte stream.
+    raw is the row as the user wrote it (echoed back for invalid rows);
+    candidate is the URL to scrape, or None when the row has no usable URL.
+    """
+    text = io.TextIOWrapper(binary_stream, encoding='utf-8-sig', errors='replace', newline='')
+    if fmt == 'ndjson':
+        yield from _iter_ndjson(text)
+    else:
+        yield from _iter_csv(text)
+
+def _url_column(row):
+    """Index of the first cell that looks like a LinkedIn URL, or None"""
+    return next((i for i, cell in enumerate(row) if 'linkedin.com/' in cell.lower()), None)
+
+def _iter_csv(text):
+    column = None
+    first_row = True
+    for row in csv.reader(text):
+        if not any(cell.strip() for cell in row):
+            continue
+        if first_row:
+            first_row = False
+            header = [cell.strip().lower() for cell in row]
+            matches = [header.index(name) for name in URL_COLUMNS if name in header]
+            if matches:
+                column = matches[0]
+                continue
+            column = _url_column(row)
+            if column is None:
+                # Unrecognised header (e.g. "Company,Website"): pick the column from the data
+                continue
+        if column is None:
+            column = _url_column(row)
+            if column is None:
+                # No URL column known yet and none in this row either
+                yield ','.join(row), None
+                continue
+        cell = row[column] if column < len(row) else ''
+        yield cell, cell
+
+def _iter_ndjson(text):
+    for line in text:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            item = json.loads(line)
+        except ValueError:
+            yield line, None  # malformed JSON, reported back as an invalid row
+            continue
+        if isinstance(item, dict):
+            item = next((item[key] for key in URL_KEYS if key in item), None)
+        yield line, item if isinstance(item, str) else None
+
+def invalid_result(raw):
+    return {
+        'url': raw if isinstance(raw, str) else json.dumps(raw),
+        'employee_count': 'NA',
+        'error': INVALID_URL_ERROR
+    }
+
+def iter_output(results, fmt):
+    """Serialize result dicts to CSV or NDJSON, one chunk per result"""
+    if fmt == 'ndjson':
+        for result in results:
+            yield json.dumps(result) + '\n'
+        return
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def flush():
+        chunk = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return chunk
+
+    writer.writerow(CSV_HEADER)
+    yield flush()
+    for result in results:
+        writer.writerow([result['url'], result['employee_count'], result.get('error') or 'Success'])
+        yield flush()
@@ -0,0 +1,149 @@
+"""
+Static asset pipeline: fingerprinting, precompression and long-lived caching.
+
+Run `python assets.py` at build time. Every file under static/ is copied into
+static/dist/ with a content hash in its name (css/portal.css ->
+css/portal.3f2a9c1e.css), text assets get .gz and .br siblings, and
+static/dist/manifest.json maps the original paths to the hashed ones.
+
+At runtime templates call asset_url('css/portal.css'). When a manifest exists
+this points at /assets/<hashed name>, served precompressed with
+`Cache-Control: immutable` so repeat page loads never hit the server for it.
+Without a build it falls back to the plain /static URL.
+"""
+from flask import Blueprint, current_app, request, send_from_directory, url_for
+import gzip
+import hashlib
+import json
+import logging
+import mimetypes
+import os
+import shutil
+
+try:
+    import brotli
+except ImportError:  # Brotli is optional; gzip variants are always built
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+DIST_DIR = 'dist'
+MANIFEST_NAME = 'manifest.json'
+COMPRESSIBLE_EXTENSIONS = ('.css', '.js', '.svg', '.json', '.html', '.txt')
+# Only worth storing a compressed variant if it is at least this much smaller
+MIN_COMPRESSION_SAVING = 0.9
+IMMUTABLE_MAX_AGE = 365 * 24 * 60 * 60  # 1 year
+
+bp = Blueprint('assets', __name__, url_prefix='/assets')
+
+_manifest = None
+
+
+# ============================================================================
+# Build
+# ============================================================================
+
+def hashed_name(path, content, length=8):
+    """Insert a content hash before the extension: css/app.css -> css/app.<hash>.css"""
+    digest = hashlib.sha256(content).hexdigest()[:length]
+    root, ext = os.path.splitext(path)
+    return f"{root}.{digest}{ext}"
+
+def _write_compressed(target, content):
+    """Write .gz (and .br when available) siblings if they actually save bytes"""
+    gz = gzip.compress(content, compresslevel=9, mtime=0)
+    if len(gz) < len(content) * MIN_COMPRESSION_SAVING:
+        with open(target + '.gz', 'wb') as f:
+            f.write(gz)
+    if brotli is not None:
+        br = brotli.compress(content, quality=11)
+        if len(br) < len(content) * MIN_COMPRESSION_SAVING:
+            with open(target + '.br', 'wb') as f:
+                f.write(br)
+
+def build(static_dir):
+    """Fingerprint and precompress everything under static_dir into static_dir/dist"""
+    dist = os.path.join(static_dir, DIST_DIR)
+    if os.path.isdir(dist):
+        shutil.rmtree(dist)
+    if brotli is None:
+        logger.warning("brotli not installed, building gzip variants only")
+
+    manifest = {}
+    for root, dirs, files in os.walk(static_dir):
+        dirs[:] = sorted(d for d in dirs if os.path.join(root, d) != dist)
+        for name in sorted(files):
+            source = os.path.join(root, name)
+            rel_path = os.path.relpath(source, static_dir).replace(os.sep, '/')
+            with open(source, 'rb') as f:
+                content = f.read()
+
+            hashed = hashed_name(rel_path, content)
+            target = os.path.join(dist, hashed)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            with open(target, 'wb') as f:
+                f.write(content)
+            if name.endswith(COMPRESSIBLE_EXTENSIONS):
+                _write_compressed(target, content)
+            manifest[rel_path] = hashed
+            logger.info(f"{rel_path} -> {DIST_DIR}/{hashed}")
+
+    with open(os.path.join(dist, MANIFEST_NAME), 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    return manifest
+
+
+# ============================================================================
+# Runtime
+# ============================================================================
+
+def load_manifest():
+    """Load (once) the manifest written by build(), or {} if assets were not built"""
+    global _manifest
+    if _manifest is None:
+        path = os.path.join(current_app.static_folder, DIST_DIR, MANIFEST_NAME)
+        try:
+            with open(path) as f:
+                _manifest = json.load(f)
+            logger.info(f"Loaded asset manifest with {len(_manifest)} entries")
+        except FileNotFoundError:
+            logger.info("No asset manifest found, serving unhashed static files")
+            _manifest = {}
+    return _manifest
+
+@bp.app_template_global()
+def asset_url(filename):
+    """URL for a static file, fingerprinted when the asset build has been run"""
+    hashed = load_manifest().get(filename)
+    if hashed is None:
+        return url_for('static', filename=filename)
+    return url_for('assets.serve', filename=hashed)
+
+@bp.route('/<path:filename>')
+def serve(filename):
+    """Serve a fingerprinted asset, preferring a precompressed variant"""
+    dist = os.path.join(current_app.static_folder, DIST_DIR)
+    mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+
+    for encoding, suffix in (('br', '.br'), ('gzip', '.gz')):
+        # Indexing gives the q-value, so "br;q=0" counts as refused
+        if request.accept_encodings[encoding] > 0 and os.path.isfile(os.path.join(dist, filename + suffix)):
+            response = send_from_directory(dist, filename + suffix, mimetype=mimetype,
+                                           max_age=IMMUTABLE_MAX_AGE)
+            response.headers['Content-Encoding'] = encoding
+            break
+    else:
+        response = send_from_directory(dist, filename, mimetype=mimetype,
+                                       max_age=IMMUTABLE_MAX_AGE)
+
+    response.vary.add('Accept-Encoding')
+    response.cache_control.public = True
+    response.cache_control.immutable = True
+    return response
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    static_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static')
+    manifest = build(static_dir)
+    print(f"Built {len(manifest)} assets into {os.path.join(static_dir, DIST_DIR)}")
@@ -0,0 +1,128 @@
+"""
+Helpers shared by the benchmark scripts: percentiles, memory, result files
+and regression comparison.
+"""
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+from datetime import datetime
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Make `import app` / `import analyst1` work when a script is run directly
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+
+def percentile(values, pct):
+    """Linear-interpolated percentile of a list of numbers (pct in 0-100)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * pct / 100.0
+    lower = int(k)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (k - lower)
+
+def latency_summary(latencies):
+    """p50/p95/p99/mean/max in milliseconds for a list of durations in seconds"""
+    if not latencies:
+        return {}
+    ms = [l * 1000 for l in latencies]
+    return {
+        'p50_ms': round(percentile(ms, 50), 2),
+        'p95_ms': round(percentile(ms, 95), 2),
+        'p99_ms': round(percentile(ms, 99), 2),
+        'mean_ms': round(sum(ms) / len(ms), 2),
+        'max_ms': round(max(ms), 2),
+    }
+
+def _maxrss_mb(who):
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    peak = resource.getrusage(who).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+def peak_rss_mb():
+    """
+    Peak RSS of this process and of its largest finished child (e.g. tesseract).
+    A child's figure includes memory inherited at fork, so it is never below
+    this process's RSS at the time it was spawned.
+    """
+    return {
+        'self_mb': round(_maxrss_mb(resource.RUSAGE_SELF), 1),
+        'largest_child_mb': round(_maxrss_mb(resource.RUSAGE_CHILDREN), 1),
+    }
+
+def process_peak_rss_mb(pid):
+    """Peak RSS (VmHWM) of another process; Linux only, None elsewhere"""
+    try:
+        with open(f'/proc/{pid}/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+    return None
+
+def git_revision():
+    """Short commit hash of the working tree (with -dirty), or None outside git"""
+    try:
+        rev = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_ROOT,
+                             capture_output=True, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=REPO_ROOT,
+                               capture_output=True, text=True, check=True).stdout.strip()
+        return rev + ('-dirty' if dirty else '')
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run_metadata(**extra):
+    """Metadata stored alongside every result file"""
+    meta = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'commit': git_revision(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+    }
+    meta.update(extra)
+    return meta
+
+def write_results(path, results):
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+    print(f"Results written to {path}")
+
+def load_results(path):
+    with open(path) as f:
+        return json.load(f)
+
+def compare(baseline, current, metrics, threshold=0.10):
+    """
+    Compare two flat {metric: value} dicts.
+
+    metrics maps metric name -> 'lower' or 'higher' (which direction is better).
+    Returns a list of (metric, baseline, current, relative_change, regressed) rows;
+    a metric regresses when it moves the wrong way by more than threshold.
+    """
+    rows = []
+    for metric, better in metrics.items():
+        old, new = baseline.get(metric), current.get(metric)
+        if old is None or new is None:
+            continue
+        change = (new - old) / old if old else 0.0
+        regressed = change > threshold if better == 'lower' else change < -threshold
+        rows.append((metric, old, new, change, regressed))
+    return rows
+
+def print_comparison(title, rows):
+    """Print compare() rows; returns True if anything regressed"""
+    print(f"\n{title}")
+    regressed_any = False
+    for metric, old, new, change, regressed in rows:
+        flag = '  REGRESSION' if regressed else ''
+        print(f"  {metric:<22} {old:>10.2f} -> {new:>10.2f}  ({change:+.1%}){flag}")
+        regressed_any = regressed_any or regressed
+    return regressed_any
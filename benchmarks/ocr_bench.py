@@ -0,0 +1,424 @@
+"""
+OCR throughput / latency benchmark for POST /analyst1/extract-text.
+
+A synthetic screenshot corpus is rendered offline with Pillow (different
+sizes, fonts, text densities, a blank image and a huge one) so every run sees
+identical input. The corpus is sent to the endpoint at a configurable
+concurrency and we report throughput, p50/p95/p99 latency, peak RSS and
+character accuracy against the known ground truth.
+
+The corpus is rendered (and preprocessed) in a worker process, because
+decoding the 8000x6000 image alone takes ~260 MB; the peak RSS reported for
+in-process runs then reflects the endpoint rather than the benchmark's setup.
+
+By default requests go through the Flask test client in this process, so no
+server is needed (Tesseract still has to be installed); admission control is
+off for those runs unless --admission is given. Use --url to drive a
+running server instead, and --server-pid to read that server's peak RSS.
+A stock server applies its admission limits to --url runs (2 requests/s,
+burst 10, per client), so start it with ADMISSION_ENABLED=0 (or raise the
+OCR_* limits) unless you mean to measure the 429/503 responses.
+
+Uploads mimic the Analyst1 page: the image is downscaled to --max-dimension,
+converted to grayscale and sent as a raw PNG body. --upload json sends the
+full-size image as a base64 data URL instead, as the page used to.
+
+Usage:
+    python benchmarks/ocr_bench.py --concurrency 4 --requests 100 --output ocr.json
+    python benchmarks/ocr_bench.py --compare ocr-main.json --output ocr-branch.json
+    python benchmarks/ocr_bench.py --url http://localhost:5001 --server-pid 1234
+    python benchmarks/ocr_bench.py --upload json   # full-size base64 uploads, for comparison
+    python benchmarks/ocr_bench.py --save-corpus /tmp/ocr-corpus
+"""
+import argparse
+import base64
+import difflib
+import io
+import json
+import logging
+import multiprocessing
+import os
+import random
+import re
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image, ImageDraw, ImageFont
+
+import common
+
+ENDPOINT = '/analyst1/extract-text'
+# Reported as the status of requests that never got an HTTP response
+CONNECTION_ERROR_STATUS = 0
+
+# First font found for each family is used; Pillow's bitmap font is the fallback
+FONT_CANDIDATES = {
+    'sans': [
+        '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf',
+        '/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf',
+        '/System/Library/Fonts/Supplemental/Arial.ttf',
+        '/Library/Fonts/Arial.ttf',
+        'C:\\Windows\\Fonts\\arial.ttf',
+    ],
+    'serif': [
+        '/usr/share/fonts/truetype/dejavu/DejaVuSerif.ttf',
+        '/usr/share/fonts/truetype/liberation/LiberationSerif-Regular.ttf',
+        '/System/Library/Fonts/Supplemental/Times New Roman.ttf',
+        'C:\\Windows\\Fonts\\times.ttf',
+    ],
+    'mono': [
+        '/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf',
+        '/usr/share/fonts/truetype/liberation/LiberationMono-Regular.ttf',
+        '/System/Library/Fonts/Supplemental/Courier New.ttf',
+        'C:\\Windows\\Fonts\\cour.ttf',
+    ],
+}
+
+# (name, canvas size, font family, font size, density)
+CORPUS_SPECS = [
+    ('single-line', (480, 80), 'sans', 20, 'line'),
+    ('screenshot-sparse', (1280, 720), 'sans', 18, 'sparse'),
+    ('screenshot-paragraph', (1280, 720), 'serif', 18, 'paragraph'),
+    ('screenshot-dense', (1280, 720), 'sans', 14, 'dense'),
+    ('code-mono', (1280, 720), 'mono', 16, 'dense'),
+    ('tiny-font', (1280, 720), 'sans', 10, 'dense'),
+    ('large-font', (1280, 720), 'sans', 40, 'sparse'),
+    ('retina', (2880, 1800), 'sans', 32, 'paragraph'),
+    ('blank', (1920, 1080), None, 0, 'blank'),
+    ('huge', (8000, 6000), 'sans', 48, 'paragraph'),
+]
+
+WORDS = (
+    'revenue growth quarter company analyst report market share employees '
+    'forecast margin product customers pipeline segment operating income '
+    'guidance headcount acquisition platform subscription retention churn '
+    'enterprise region pricing expansion strategy board investors capital '
+    'The 2024 Q3 EBITDA 12.5% $4.2M 1,024 ARR YoY North America EMEA APAC'
+).split()
+
+MARGIN = 20
+# Fraction of the canvas height filled with text for each density
+DENSITY_FILL = {'line': None, 'sparse': 0.3, 'paragraph': 0.6, 'dense': 1.0}
+
+
+def load_font(family, size):
+    for path in FONT_CANDIDATES.get(family, []):
+        if os.path.exists(path):
+            return ImageFont.truetype(path, size), os.path.basename(path)
+    return ImageFont.load_default(), 'pillow-default'
+
+def _wrap_words(rng, font, width, n_lines):
+    """Generate n_lines lines of random words that fit within width pixels"""
+    lines = []
+    for _ in range(n_lines):
+        words = []
+        while True:
+            candidate = ' '.join(words + [rng.choice(WORDS)])
+            if words and font.getlength(candidate) > width:
+                break
+            words = candidate.split(' ')
+        lines.append(' '.join(words))
+    return lines
+
+def render_case(name, size, family, font_size, density, seed):
+    """Render one corpus image; returns a dict with the PNG bytes and ground truth"""
+    rng = random.Random(f'{seed}:{name}')
+    image = Image.new('RGB', size, 'white')
+    font_name = None
+    lines = []
+
+    if density != 'blank':
+        font, font_name = load_font(family, font_size)
+        draw = ImageDraw.Draw(image)
+        ascent, descent = font.getmetrics()
+        line_height = int((ascent + descent) * (2.0 if density == 'sparse' else 1.4))
+        usable_height = size[1] - 2 * MARGIN
+        if density == 'line':
+            n_lines = 1
+        else:
+            n_lines = max(1, int(usable_height * DENSITY_FILL[density]) // line_height)
+        lines = _wrap_words(rng, font, size[0] - 2 * MARGIN, n_lines)
+        for i, line in enumerate(lines):
+            draw.text((MARGIN, MARGIN + i * line_height), line, fill='black', font=font)
+
+    buffer = io.BytesIO()
+    image.save(buffer, format='PNG')
+    png = buffer.getvalue()
+    return {
+        'name': name,
+        'size': size,
+        'font': font_name,
+        'font_size': font_size,
+        'density': density,
+        'truth': '\n'.join(lines),
+        'png': png,
+    }
+
+def build_corpus(seed, only=None):
+    return [render_case(*spec, seed=seed) for spec in CORPUS_SPECS
+            if only is None or spec[0] in only]
+
+def browser_preprocess(png, max_dimension):
+    """Pillow equivalent of prepareForOcr() in static/js/analyst1/app.js"""
+    image = Image.open(io.BytesIO(png)).convert('L')
+    scale = min(1.0, max_dimension / max(image.size))
+    if scale < 1:
+        size = (max(1, round(image.width * scale)), max(1, round(image.height * scale)))
+        image = image.resize(size, Image.LANCZOS)
+    # canvas.toBlob() / convertToBlob() always encode RGBA, even after toGrayscale()
+    image = image.convert('RGBA')
+    buffer = io.BytesIO()
+    image.save(buffer, format='PNG')
+    processed = buffer.getvalue()
+    return png if scale == 1 and len(processed) >= len(png) else processed
+
+def attach_payloads(corpus, upload, max_dimension):
+    """
+    Build each case's request body.
+    json: {"image": data URL} of the full-size PNG (the original page behaviour)
+    raw:  the PNG as the request body, after browser-style preprocessing
+    """
+    for case in corpus:
+        if upload == 'json':
+            data_url = 'data:image/png;base64,' + base64.b64encode(case['png']).decode('ascii')
+            case['body'] = json.dumps({'image': data_url}).encode('utf-8')
+            case['content_type'] = 'application/json'
+        else:
+            case['body'] = browser_preprocess(case['png'], max_dimension) if max_dimension else case['png']
+            case['content_type'] = 'image/png'
+
+def prepare_corpus(seed, only, upload, max_dimension):
+    """Render the corpus and build the request bodies; returns (corpus, peak RSS MB of this process)"""
+    corpus = build_corpus(seed, only)
+    attach_payloads(corpus, upload, max_dimension)
+    for case in corpus:
+        del case['png']  # only the request body is sent back
+    return corpus, common.peak_rss_mb()['self_mb']
+
+def prepare_corpus_in_worker(*args):
+    """
+    Run prepare_corpus() in a separate process so rendering does not inflate
+    this process's peak RSS. A forkserver worker is a child of the fork server,
+    not of us, so it does not show up in our RUSAGE_CHILDREN figure either
+    (which should only see tesseract).
+    """
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+    with context.Pool(1) as pool:
+        return pool.apply(prepare_corpus, args)
+
+def save_corpus(corpus, directory):
+    os.makedirs(directory, exist_ok=True)
+    for case in corpus:
+        with open(os.path.join(directory, case['name'] + '.png'), 'wb') as f:
+            f.write(case['png'])
+        with open(os.path.join(directory, case['name'] + '.txt'), 'w') as f:
+            f.write(case['truth'])
+    print(f"Saved {len(corpus)} images to {directory}")
+
+
+def _normalize(text):
+    return re.sub(r'\s+', ' ', text or '').strip()
+
+def char_accuracy(truth, text):
+    """Fraction of ground-truth characters recovered in order (whitespace-normalized)"""
+    truth, text = _normalize(truth), _normalize(text)
+    if not truth:
+        return 1.0 if not text else 0.0
+    matcher = difflib.SequenceMatcher(None, truth, text, autojunk=False)
+    matched = sum(block.size for block in matcher.get_matching_blocks())
+    # Penalize hallucinated extra characters as well as missing ones
+    return round(max(0.0, (matched - max(0, len(text) - len(truth))) / len(truth)), 4)
+
+
+class InProcessTarget:
+    """Posts to the Flask app through its test client"""
+
+    def __init__(self, admission):
+        # All in-process requests share one client address, so per-client
+        # admission limits would dominate the numbers unless asked for
+        if not admission:
+            os.environ['ADMISSION_ENABLED'] = '0'
+        import app as portal
+        # The app logs at DEBUG; keep benchmark output readable
+        logging.getLogger().setLevel(logging.WARNING)
+        self.app = portal.app
+        self.description = 'in-process'
+
+    def post(self, body, content_type):
+        response = self.app.test_client().post(ENDPOINT, data=body, content_type=content_type)
+        return response.status_code, response.get_json(silent=True) or {}
+
+class HttpTarget:
+    """Posts to a running server over HTTP"""
+
+    def __init__(self, base_url, timeout):
+        self.url = base_url.rstrip('/') + ENDPOINT
+        self.timeout = timeout
+        self.description = self.url
+
+    def post(self, body, content_type):
+        req = urllib.request.Request(self.url, data=body, headers={'Content-Type': content_type})
+        try:
+            with urllib.request.urlopen(req, timeout=self.timeout) as response:
+                return response.status, json.loads(response.read() or b'{}')
+        except urllib.error.HTTPError as e:
+            try:
+                return e.code, json.loads(e.read() or b'{}')
+            except ValueError:
+                return e.code, {}
+        except (urllib.error.URLError, OSError) as e:
+            # Connection refused / reset or timeout: record it, don't abort the run
+            return CONNECTION_ERROR_STATUS, {'error': f'{type(e).__name__}: {e}'}
+
+
+def run(target, corpus, n_requests, concurrency, warmup):
+    """Send n_requests (round-robin over the corpus) at the given concurrency"""
+    outputs = {}
+    for case in corpus[:warmup and len(corpus)]:
+        for _ in range(warmup):
+            _, data = target.post(case['body'], case['content_type'])
+            outputs.setdefault(case['name'], data.get('text'))
+
+    samples = []
+    errors = {}
+    lock = threading.Lock()
+
+    def one(case):
+        start = time.perf_counter()
+        status, data = target.post(case['body'], case['content_type'])
+        elapsed = time.perf_counter() - start
+        ok = status == 200 and data.get('success', False)
+        with lock:
+            samples.append((case['name'], elapsed, ok, status))
+            if ok:
+                outputs.setdefault(case['name'], data.get('text'))
+            else:
+                errors.setdefault(status, data.get('error'))
+
+    jobs = [corpus[i % len(corpus)] for i in range(n_requests)]
+    wall_start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(one, jobs))
+    wall = time.perf_counter() - wall_start
+    return samples, outputs, errors, wall
+
+def summarize(corpus, samples, outputs, errors, wall):
+    cases = {}
+    for case in corpus:
+        case_samples = [s for s in samples if s[0] == case['name']]
+        ok = [s[1] for s in case_samples if s[2]]
+        entry = {
+            'size': f"{case['size'][0]}x{case['size'][1]}",
+            'font': case['font'],
+            'font_size': case['font_size'],
+            'density': case['density'],
+            'payload_kb': round(len(case['body']) / 1024, 1),
+            'requests': len(case_samples),
+            'errors': len(case_samples) - len(ok),
+            'char_accuracy': (char_accuracy(case['truth'], outputs[case['name']])
+                              if outputs.get(case['name']) is not None else None),
+        }
+        entry.update(common.latency_summary(ok))
+        cases[case['name']] = entry
+
+    ok_latencies = [s[1] for s in samples if s[2]]
+    accuracies = [c['char_accuracy'] for c in cases.values() if c['char_accuracy'] is not None]
+    summary = {
+        'requests': len(samples),
+        'errors': len(samples) - len(ok_latencies),
+        'error_messages': {str(status): message for status, message in errors.items()},
+        'wall_s': round(wall, 3),
+        'throughput_rps': round(len(ok_latencies) / wall, 3) if wall else 0.0,
+        'char_accuracy': round(sum(accuracies) / len(accuracies), 4) if accuracies else None,
+    }
+    summary.update(common.latency_summary(ok_latencies))
+    return summary, cases
+
+SUMMARY_METRICS = {
+    'throughput_rps': 'higher',
+    'p50_ms': 'lower',
+    'p95_ms': 'lower',
+    'p99_ms': 'lower',
+    'char_accuracy': 'higher',
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--url', help='Base URL of a running server (default: in-process test client)')
+    parser.add_argument('--server-pid', type=int, help='PID of the --url server, to report its peak RSS')
+    parser.add_argument('--concurrency', type=int, default=4)
+    parser.add_argument('--requests', type=int, default=50, help='Measured requests, round-robin over the corpus')
+    parser.add_argument('--warmup', type=int, default=1, help='Unmeasured requests per corpus image')
+    parser.add_argument('--admission', action='store_true',
+                        help='Keep admission control enabled for in-process runs')
+    parser.add_argument('--upload', choices=['raw', 'json'], default='raw',
+                        help='raw: preprocessed image body like the page sends; json: full-size base64 data URL')
+    parser.add_argument('--max-dimension', type=int, default=2000,
+                        help='Browser-side downscale target for --upload raw (0 disables preprocessing)')
+    parser.add_argument('--timeout', type=float, default=300, help='Per-request timeout for --url (seconds)')
+    parser.add_argument('--seed', default='analyst1', help='Corpus seed; keep fixed to compare runs')
+    parser.add_argument('--case', action='append', help='Only run the named corpus case(s)')
+    parser.add_argument('--save-corpus', metavar='DIR', help='Write the corpus images and truth text, then exit')
+    parser.add_argument('--output', help='Write results as JSON to this path')
+    parser.add_argument('--compare', metavar='BASELINE', help='Compare against an earlier --output file')
+    parser.add_argument('--threshold', type=float, default=0.10, help='Relative change counted as a regression')
+    args = parser.parse_args()
+
+    only = set(args.case) if args.case else None
+    if args.save_corpus:
+        save_corpus(build_corpus(args.seed, only), args.save_corpus)
+        return 0
+
+    corpus, corpus_rss = prepare_corpus_in_worker(args.seed, only, args.upload, args.max_dimension)
+    target = HttpTarget(args.url, args.timeout) if args.url else InProcessTarget(args.admission)
+    print(f"OCR benchmark: {len(corpus)} corpus images, {args.requests} requests, "
+          f"concurrency {args.concurrency}, target {target.description}")
+
+    samples, outputs, errors, wall = run(target, corpus, args.requests, args.concurrency, args.warmup)
+    summary, cases = summarize(corpus, samples, outputs, errors, wall)
+    summary['peak_rss'] = (common.process_peak_rss_mb(args.server_pid) if args.server_pid
+                           else common.peak_rss_mb() if not args.url else None)
+    summary['corpus_build_rss_mb'] = corpus_rss
+
+    print(f"\n{'case':<22}{'size':>11}{'req':>5}{'err':>5}{'p50 ms':>10}{'p95 ms':>10}{'acc':>7}")
+    for name, c in cases.items():
+        acc = f"{c['char_accuracy']:.3f}" if c['char_accuracy'] is not None else '-'
+        print(f"{name:<22}{c['size']:>11}{c['requests']:>5}{c['errors']:>5}"
+              f"{c.get('p50_ms', float('nan')):>10.1f}{c.get('p95_ms', float('nan')):>10.1f}{acc:>7}")
+    print(f"\nthroughput {summary['throughput_rps']:.2f} req/s  "
+          f"p50 {summary.get('p50_ms', float('nan')):.1f} ms  "
+          f"p95 {summary.get('p95_ms', float('nan')):.1f} ms  "
+          f"p99 {summary.get('p99_ms', float('nan')):.1f} ms  "
+          f"errors {summary['errors']}/{summary['requests']}  "
+          f"peak rss {summary['peak_rss']}  (corpus build {corpus_rss} MB, not included)")
+    for status, message in summary['error_messages'].items():
+        label = 'connection error' if status == str(CONNECTION_ERROR_STATUS) else f'HTTP {status}'
+        print(f"  {label}: {message}")
+
+    results = {
+        'meta': common.run_metadata(benchmark='ocr', target=target.description, seed=args.seed,
+                                    upload=args.upload, max_dimension=args.max_dimension,
+                                    concurrency=args.concurrency, requests=args.requests),
+        'summary': summary,
+        'cases': cases,
+    }
+    if args.output:
+        common.write_results(args.output, results)
+
+    if args.compare:
+        baseline = common.load_results(args.compare)
+        rows = common.compare(baseline['summary'], summary, SUMMARY_METRICS, args.threshold)
+        regressed = common.print_comparison(
+            f"vs {args.compare} ({baseline['meta'].get('commit')})", rows)
+        return 1 if regressed else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,408 @@
+"""
+Offline benchmark for the Analyst2 scrape path.
+
+Saved LinkedIn people pages (benchmarks/fixtures/linkedin/) are served from a
+local stub HTTP server and the real pipeline - scraper.scrape_urls() ->
+scrape_linkedin_company() -> extract_employee_count() - is run against them,
+with the scraper's random human-like pauses switched off. Time is broken
+down per stage so we can see how long our own code takes, independent of
+LinkedIn and the network.
+
+Stages (exclusive time, in ms per URL):
+    login           login_to_linkedin() (a no-op without credentials)
+    navigate        driver.get() against the stub server
+    wait_for_body   WebDriverWait for <body>
+    human_behavior  delay / mouse / scroll helpers (pauses are disabled)
+    element_lookup  find_elements('.artdeco-carousel__heading')
+    page_source     fetching driver.page_source for the fallback search
+    extract         our own parsing / regex work in extract_employee_count()
+    overhead        everything else in scrape_linkedin_company()
+
+navigate, wait_for_body, element_lookup and page_source are driver-side cost
+(for the fake driver that is urllib + html.parser); extract, overhead and
+human_behavior are our own code.
+
+--driver fake (default) uses an in-process fake WebDriver that fetches the
+stub pages with urllib and parses them with html.parser; --driver chrome uses
+a local headless Chrome instead.
+
+Usage:
+    python benchmarks/scrape_bench.py --iterations 20 --output scrape.json
+    python benchmarks/scrape_bench.py --compare scrape-main.json
+    python benchmarks/scrape_bench.py --driver chrome --iterations 5
+"""
+import argparse
+import logging
+import os
+import sys
+import threading
+import time
+import urllib.request
+from collections import defaultdict
+from html.parser import HTMLParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import common
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'linkedin')
+
+# fixture slug -> expected employee count (None: the scraper should report NA)
+EXPECTED_COUNTS = {
+    'carousel': 1234,
+    'page-source': 5678,
+    'login-wall': None,
+}
+# Synthetic fixture: page-source.html padded to stress the page source fallback
+LARGE_FIXTURE = 'large-page-source'
+LARGE_PADDING_BYTES = 2 * 1024 * 1024
+
+STAGES = ['login', 'navigate', 'wait_for_body', 'human_behavior',
+          'element_lookup', 'page_source', 'extract', 'overhead']
+
+
+# ============================================================================
+# Stub server
+# ============================================================================
+
+def load_fixtures():
+    pages = {}
+    for slug in EXPECTED_COUNTS:
+        with open(os.path.join(FIXTURE_DIR, slug + '.html'), 'rb') as f:
+            pages[slug] = f.read()
+    filler = b'<div class="feed-shared-update-v2">Lorem ipsum dolor sit amet</div>\n'
+    padding = filler * (LARGE_PADDING_BYTES // len(filler))
+    pages[LARGE_FIXTURE] = pages['page-source'].replace(b'<main', padding + b'<main', 1)
+    return pages
+
+def start_stub_server(pages):
+    """Serve /company/<slug>/people/ from pages on an ephemeral localhost port"""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            parts = [p for p in self.path.split('?')[0].split('/') if p]
+            body = pages.get(parts[1]) if len(parts) >= 2 and parts[0] == 'company' else None
+            if body is None:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+# ============================================================================
+# Drivers
+# ============================================================================
+
+class _ClassTextParser(HTMLParser):
+    """Collect the text of every element carrying a given CSS class"""
+
+    VOID_TAGS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+                 'link', 'meta', 'source', 'track', 'wbr'}
+
+    def __init__(self, css_class):
+        super().__init__()
+        self.css_class = css_class
+        self.depth = 0
+        self.open = []  # (depth, text parts) for matching elements still open
+        self.texts = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.VOID_TAGS:
+            return
+        self.depth += 1
+        classes = (dict(attrs).get('class') or '').split()
+        if self.css_class in classes:
+            self.open.append((self.depth, []))
+
+    def handle_endtag(self, tag):
+        if tag in self.VOID_TAGS:
+            return
+        if self.open and self.open[-1][0] == self.depth:
+            _, parts = self.open.pop()
+            self.texts.append(' '.join(''.join(parts).split()))
+        self.depth -= 1
+
+    def handle_data(self, data):
+        for _, parts in self.open:
+            parts.append(data)
+
+class FakeElement:
+    def __init__(self, text):
+        self.text = text
+
+class FakeDriver:
+    """
+    Just enough of the WebDriver API for the scraper: navigation, CSS class
+    lookup, page_source and no-op scripts / actions.
+    """
+
+    def __init__(self):
+        self.current_url = 'about:blank'
+        self.window_handles = ['fake-window']
+        self.page_source = '<html><body></body></html>'
+
+    def get(self, url):
+        with urllib.request.urlopen(url, timeout=30) as response:
+            self.page_source = response.read().decode('utf-8')
+        self.current_url = url
+
+    def find_element(self, by, value):
+        return FakeElement('')
+
+    def find_elements(self, by, value):
+        if not value.startswith('.'):
+            return []
+        parser = _ClassTextParser(value[1:])
+        parser.feed(self.page_source)
+        return [FakeElement(text) for text in parser.texts]
+
+    def execute_script(self, script, *args):
+        if 'innerHeight' in script:
+            return 1080
+        return None
+
+    def execute(self, command, params=None):
+        # ActionChains.perform() ends up here
+        return {'value': None}
+
+    def execute_cdp_cmd(self, cmd, params):
+        return {}
+
+    def set_page_load_timeout(self, seconds):
+        pass
+
+    def implicitly_wait(self, seconds):
+        pass
+
+    def quit(self):
+        pass
+
+def make_chrome_driver():
+    """Local headless Chrome (Selenium Manager locates chromedriver)"""
+    from selenium import webdriver
+    options = webdriver.ChromeOptions()
+    options.add_argument('--headless=new')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--window-size=1920,1080')
+    return webdriver.Chrome(options=options)
+
+
+# ============================================================================
+# Stage timing
+# ============================================================================
+
+class StageTimer:
+    """
+    Exclusive per-stage timing: while a nested stage runs, its parent's clock
+    is paused, so stage times add up to the total without double counting.
+    """
+
+    def __init__(self):
+        self.totals = defaultdict(float)
+        self.stack = []  # [stage, resumed_at]
+        self.lock = threading.Lock()
+
+    def enter(self, stage):
+        now = time.perf_counter()
+        if self.stack:
+            parent = self.stack[-1]
+            self.totals[parent[0]] += now - parent[1]
+        self.stack.append([stage, now])
+
+    def exit(self):
+        now = time.perf_counter()
+        stage, resumed_at = self.stack.pop()
+        self.totals[stage] += now - resumed_at
+        if self.stack:
+            self.stack[-1][1] = now
+
+    def wrap(self, stage, func):
+        def timed(*args, **kwargs):
+            self.enter(stage)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.exit()
+        return timed
+
+    def take(self):
+        """Return and reset the accumulated totals"""
+        totals, self.totals = dict(self.totals), defaultdict(float)
+        return totals
+
+class TimedDriver:
+    """Wraps a driver so navigation, lookups and page_source are attributed to stages"""
+
+    def __init__(self, driver, timer):
+        self._driver = driver
+        self._timer = timer
+        self.get = timer.wrap('navigate', driver.get)
+        self.find_element = timer.wrap('wait_for_body', driver.find_element)
+        self.find_elements = timer.wrap('element_lookup', driver.find_elements)
+
+    @property
+    def page_source(self):
+        self._timer.enter('page_source')
+        try:
+            return self._driver.page_source
+        finally:
+            self._timer.exit()
+
+    def __getattr__(self, name):
+        return getattr(self._driver, name)
+
+def instrument(scraper, timer, driver):
+    """Install the timed driver and stage wrappers into the scraper module"""
+    scraper.human_delays_enabled = False
+    scraper.driver_instance = driver
+    # Never fall back to launching the visible production browser
+    scraper.create_driver = lambda: driver
+    scraper.scrape_linkedin_company = timer.wrap('overhead', scraper.scrape_linkedin_company)
+    scraper.login_to_linkedin = timer.wrap('login', scraper.login_to_linkedin)
+    scraper.extract_employee_count = timer.wrap('extract', scraper.extract_employee_count)
+    for name in ('short_delay', 'human_like_delay', 'move_mouse_randomly', 'scroll_page_human_like',
+                 'pause_between_urls'):
+        setattr(scraper, name, timer.wrap('human_behavior', getattr(scraper, name)))
+
+
+# ============================================================================
+# Run
+# ============================================================================
+
+def run(scraper, timer, base_url, slugs, iterations):
+    """Scrape every fixture `iterations` times; returns per-URL samples and wall time"""
+    urls = [f'{base_url}/company/{slug}' for slug in slugs] * iterations
+    samples = []
+    wall_start = time.perf_counter()
+    url_start = time.perf_counter()
+    for url, result in zip(urls, scraper.scrape_urls(urls)):
+        elapsed = time.perf_counter() - url_start
+        slug = url.rsplit('/', 1)[-1]
+        expected = EXPECTED_COUNTS.get(slug, EXPECTED_COUNTS['page-source'])
+        got = None if result['employee_count'] == 'NA' else int(result['employee_count'])
+        samples.append({'slug': slug, 'total': elapsed, 'stages': timer.take(),
+                        'correct': got == expected, 'result': result})
+        url_start = time.perf_counter()
+    return samples, time.perf_counter() - wall_start
+
+def summarize(samples, wall):
+    def stage_summary(values):
+        ms = [v * 1000 for v in values]
+        return {'mean_ms': round(sum(ms) / len(ms), 3),
+                'p50_ms': round(common.percentile(ms, 50), 3),
+                'p95_ms': round(common.percentile(ms, 95), 3)}
+
+    def group(subset):
+        entry = {'urls': len(subset),
+                 'incorrect': sum(1 for s in subset if not s['correct']),
+                 'total': stage_summary([s['total'] for s in subset]),
+                 'stages': {}}
+        for stage in STAGES:
+            entry['stages'][stage] = stage_summary([s['stages'].get(stage, 0.0) for s in subset])
+        return entry
+
+    summary = group(samples)
+    summary['wall_s'] = round(wall, 3)
+    summary['urls_per_s'] = round(len(samples) / wall, 2) if wall else 0.0
+    fixtures = {}
+    for slug in dict.fromkeys(s['slug'] for s in samples):
+        fixtures[slug] = group([s for s in samples if s['slug'] == slug])
+    return summary, fixtures
+
+def flatten(summary, min_ms):
+    """{metric: value} for compare(); stages faster than min_ms are too noisy to gate on"""
+    flat = {'total.mean_ms': summary['total']['mean_ms'], 'total.p95_ms': summary['total']['p95_ms']}
+    for stage, values in summary['stages'].items():
+        if values['mean_ms'] >= min_ms:
+            flat[f'{stage}.mean_ms'] = values['mean_ms']
+    return flat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--driver', choices=['fake', 'chrome'], default='fake')
+    parser.add_argument('--iterations', type=int, default=10, help='Passes over the fixture set')
+    parser.add_argument('--fixture', action='append', help='Only scrape the named fixture(s)')
+    parser.add_argument('--output', help='Write results as JSON to this path')
+    parser.add_argument('--compare', metavar='BASELINE', help='Compare against an earlier --output file')
+    parser.add_argument('--threshold', type=float, default=0.20, help='Relative slowdown counted as a regression')
+    parser.add_argument('--min-ms', type=float, default=0.5, help='Ignore stages below this mean when comparing')
+    parser.add_argument('--verbose', action='store_true', help='Keep the scraper\'s INFO/DEBUG logging')
+    args = parser.parse_args()
+
+    # Make sure the harness never attempts a real LinkedIn login
+    os.environ.pop('LINKEDIN_EMAIL', None)
+    os.environ.pop('LINKEDIN_PASSWORD', None)
+
+    from analyst2 import scraper
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.WARNING)
+    if not args.verbose:
+        # Every login-less scrape logs warnings; they would drown the report
+        logging.getLogger(scraper.__name__).setLevel(logging.ERROR)
+
+    pages = load_fixtures()
+    slugs = args.fixture or list(pages)
+    server = start_stub_server(pages)
+    base_url = f'http://127.0.0.1:{server.server_address[1]}'
+
+    timer = StageTimer()
+    raw_driver = make_chrome_driver() if args.driver == 'chrome' else FakeDriver()
+    instrument(scraper, timer, TimedDriver(raw_driver, timer))
+    print(f"Scrape benchmark: {len(slugs)} fixtures x {args.iterations} iterations, "
+          f"{args.driver} driver, stub server {base_url}")
+
+    try:
+        samples, wall = run(scraper, timer, base_url, slugs, args.iterations)
+    finally:
+        raw_driver.quit()
+        server.shutdown()
+
+    summary, fixtures = summarize(samples, wall)
+
+    print(f"\n{'stage':<16}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}")
+    for stage in STAGES:
+        s = summary['stages'][stage]
+        print(f"{stage:<16}{s['mean_ms']:>10.3f}{s['p50_ms']:>10.3f}{s['p95_ms']:>10.3f}")
+    t = summary['total']
+    print(f"{'total':<16}{t['mean_ms']:>10.3f}{t['p50_ms']:>10.3f}{t['p95_ms']:>10.3f}")
+    print(f"\n{'fixture':<20}{'mean ms':>10}{'incorrect':>11}")
+    for slug, f in fixtures.items():
+        print(f"{slug:<20}{f['total']['mean_ms']:>10.3f}{f['incorrect']:>11}")
+    print(f"\n{summary['urls_per_s']} URLs/s, {summary['incorrect']} incorrect results")
+    for s in samples:
+        if not s['correct']:
+            print(f"  unexpected result for {s['slug']}: {s['result']}")
+            break
+
+    results = {
+        'meta': common.run_metadata(benchmark='scrape', driver=args.driver,
+                                    iterations=args.iterations, fixtures=slugs),
+        'summary': summary,
+        'fixtures': fixtures,
+    }
+    if args.output:
+        common.write_results(args.output, results)
+
+    status = 1 if summary['incorrect'] else 0
+    if args.compare:
+        baseline = common.load_results(args.compare)
+        current = flatten(summary, args.min_ms)
+        previous = flatten(baseline['summary'], args.min_ms)
+        rows = common.compare(previous, current, {m: 'lower' for m in current}, args.threshold)
+        if common.print_comparison(f"vs {args.compare} ({baseline['meta'].get('commit')})", rows):
+            status = 1
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
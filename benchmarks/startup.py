@@ -0,0 +1,112 @@
+"""
+Measure cold-start cost of the portal in each deployment mode.
+
+Every mode runs in a fresh interpreter so import caches and RSS are not shared.
+For each mode we record how long `import app` takes, the peak RSS afterwards,
+and whether the browser stack got loaded. With --first-use the enabled
+subsystems are then imported as the first request would, to show what the
+lazy loading defers.
+
+Usage:
+    python benchmarks/startup.py
+    python benchmarks/startup.py --repeat 5 --first-use --output startup.json
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODES = {
+    'all': {'ANALYST1_ENABLED': '1', 'ANALYST2_ENABLED': '1'},
+    'ocr-only': {'ANALYST1_ENABLED': '1', 'ANALYST2_ENABLED': '0'},
+    'scraper-only': {'ANALYST1_ENABLED': '0', 'ANALYST2_ENABLED': '1'},
+}
+
+# Runs inside the child interpreter; prints a single JSON line.
+PROBE = r'''
+import json, resource, sys, time
+
+def rss_mb():
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+base_rss = rss_mb()
+start = time.perf_counter()
+import app
+import_s = time.perf_counter() - start
+result = {
+    'import_s': import_s,
+    'base_rss_mb': base_rss,
+    'rss_mb': rss_mb(),
+    'selenium_loaded': 'selenium' in sys.modules,
+    'pytesseract_loaded': 'pytesseract' in sys.modules,
+}
+if FIRST_USE:
+    start = time.perf_counter()
+    if app.app.config['ANALYST1_ENABLED']:
+        import analyst1
+        analyst1.get_ocr()
+    if app.app.config['ANALYST2_ENABLED']:
+        import analyst2
+        analyst2.get_scraper()
+    result['first_use_s'] = time.perf_counter() - start
+    result['first_use_rss_mb'] = rss_mb()
+print(json.dumps(result))
+'''
+
+
+def run_probe(mode_env, first_use):
+    env = dict(os.environ, **mode_env)
+    code = PROBE.replace('FIRST_USE', 'True' if first_use else 'False')
+    proc = subprocess.run(
+        [sys.executable, '-c', code],
+        cwd=REPO_ROOT, env=env, capture_output=True, text=True, check=True
+    )
+    # The app logs to stderr; the probe's JSON is the last line on stdout
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def summarize(samples):
+    summary = {}
+    for key in samples[0]:
+        values = [s[key] for s in samples]
+        if isinstance(values[0], bool):
+            summary[key] = values[0]
+        else:
+            summary[key] = round(statistics.median(values), 4)
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per mode (median is reported)')
+    parser.add_argument('--first-use', action='store_true', help='Also import enabled subsystems after startup')
+    parser.add_argument('--mode', choices=sorted(MODES), action='append', help='Limit to one or more modes')
+    parser.add_argument('--output', help='Write results as JSON to this path')
+    args = parser.parse_args()
+
+    results = {}
+    for mode in args.mode or MODES:
+        samples = [run_probe(MODES[mode], args.first_use) for _ in range(args.repeat)]
+        results[mode] = summarize(samples)
+        r = results[mode]
+        line = (f"{mode:<13} import {r['import_s'] * 1000:7.1f} ms  "
+                f"rss {r['rss_mb']:6.1f} MB  selenium={r['selenium_loaded']}")
+        if args.first_use:
+            line += (f"  first use +{r['first_use_s'] * 1000:.1f} ms "
+                     f"-> {r['first_use_rss_mb']:.1f} MB")
+        print(line)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
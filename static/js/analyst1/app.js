@@ -11,6 +11,15 @@ const loading = document.getElementById('loading');
 const error = document.getElementById('error');
 const errorMessage = document.getElementById('errorMessage');
 
+// Upload settings advertised by the server (see OCR_UPLOAD in app.py)
+const uploadSettings = Object.assign({
+    max_dimension: 2000,
+    grayscale: true,
+    format: 'image/png',
+    quality: 0.92
+}, JSON.parse(uploadArea.dataset.ocrUpload || '{}'));
+let previewUrl = null;
+
 // Handle paste event
 document.addEventListener('paste', async (e) => {
     const items = e.clipboardData.items;
@@ -61,30 +70,37 @@ async function processImage(file) {
     // Hide error
     hideError();
     
-    // Show preview
-    const reader = new FileReader();
-    reader.onload = (e) => {
-        previewImage.src = e.target.result;
-        previewSection.style.display = 'block';
-        uploadArea.style.display = 'none';
-    };
-    reader.readAsDataURL(file);
-    
-    // Convert file to base64
-    const base64 = await fileToBase64(file);
+    // Show preview (object URL avoids reading the whole file into a data URL)
+    if (previewUrl) {
+        URL.revokeObjectURL(previewUrl);
+    }
+    previewUrl = URL.createObjectURL(file);
+    previewImage.src = previewUrl;
+    previewSection.style.display = 'block';
+    uploadArea.style.display = 'none';
     
     // Show loading
     loading.style.display = 'block';
     resultSection.style.display = 'none';
     
     try {
-        // Send to server
+        // Downscale / grayscale in the browser, falling back to the original file
+        let upload = file;
+        try {
+            upload = await prepareForOcr(file);
+        } catch (prepErr) {
+            console.warn('Image preprocessing failed, uploading original:', prepErr);
+        }
+        
+        // Send the encoded image as the raw request body (no base64 overhead).
+        // Files the browser can't type (e.g. some HEIC/TIFF drops) go as octet-stream.
+        const contentType = upload.type.startsWith('image/') ? upload.type : 'application/octet-stream';
         const response = await fetch('/analyst1/extract-text', {
             method: 'POST',
             headers: {
-                'Content-Type': 'application/json',
+                'Content-Type': contentType,
             },
-            body: JSON.stringify({ image: base64 })
+            body: upload
         });
         
         const data = await response.json();
@@ -105,13 +121,58 @@ async function processImage(file) {
     }
 }
 
-// Convert file to base64
-function fileToBase64(file) {
+// Downsample to the server's preferred size, convert to grayscale and re-encode.
+// Returns whichever of the processed or original image is smaller when no resize was needed.
+async function prepareForOcr(file) {
+    const bitmap = await createImageBitmap(file);
+    const longSide = Math.max(bitmap.width, bitmap.height);
+    const scale = Math.min(1, uploadSettings.max_dimension / longSide);
+    const width = Math.max(1, Math.round(bitmap.width * scale));
+    const height = Math.max(1, Math.round(bitmap.height * scale));
+    
+    const canvas = typeof OffscreenCanvas !== 'undefined'
+        ? new OffscreenCanvas(width, height)
+        : Object.assign(document.createElement('canvas'), { width: width, height: height });
+    const ctx = canvas.getContext('2d', { willReadFrequently: uploadSettings.grayscale });
+    
+    // Transparent screenshot regions would otherwise turn black in JPEG / grayscale
+    ctx.fillStyle = '#ffffff';
+    ctx.fillRect(0, 0, width, height);
+    ctx.imageSmoothingEnabled = true;
+    ctx.imageSmoothingQuality = 'high';
+    ctx.drawImage(bitmap, 0, 0, width, height);
+    bitmap.close();
+    
+    if (uploadSettings.grayscale) {
+        toGrayscale(ctx, width, height);
+    }
+    
+    const blob = await canvasToBlob(canvas, uploadSettings.format, uploadSettings.quality);
+    if (scale === 1 && blob.size >= file.size) {
+        return file;
+    }
+    return blob;
+}
+
+// Replace RGB with luma so the encoder sees a single effective channel
+function toGrayscale(ctx, width, height) {
+    const imageData = ctx.getImageData(0, 0, width, height);
+    const pixels = imageData.data;
+    for (let i = 0; i < pixels.length; i += 4) {
+        const luma = Math.round(0.299 * pixels[i] + 0.587 * pixels[i + 1] + 0.114 * pixels[i + 2]);
+        pixels[i] = luma;
+        pixels[i + 1] = luma;
+        pixels[i + 2] = luma;
+    }
+    ctx.putImageData(imageData, 0, 0);
+}
+
+function canvasToBlob(canvas, type, quality) {
+    if (canvas.convertToBlob) {
+        return canvas.convertToBlob({ type: type, quality: quality });
+    }
     return new Promise((resolve, reject) => {
-        const reader = new FileReader();
-        reader.readAsDataURL(file);
-        reader.onload = () => resolve(reader.result);
-        reader.onerror = error => reject(error);
+        canvas.toBlob(blob => blob ? resolve(blob) : reject(new Error('Canvas encoding failed')), type, quality);
     });
 }
 
@@ -140,6 +201,10 @@ clearBtn.addEventListener('click', () => {
     resultSection.style.display = 'none';
     uploadArea.style.display = 'block';
     fileInput.value = '';
+    if (previewUrl) {
+        URL.revokeObjectURL(previewUrl);
+        previewUrl = null;
+    }
     hideError();
 });
 
@@ -11,6 +11,10 @@ const resultSection = document.getElementById('resultSection');
 const resultsTableBody = document.getElementById('resultsTableBody');
 const exportCsvBtn = document.getElementById('exportCsvBtn');
 const copyTableBtn = document.getElementById('copyTableBtn');
+const bulkForm = document.getElementById('bulkForm');
+const bulkHint = document.getElementById('bulkHint');
+const bulkDownloadFrame = document.getElementById('bulkDownloadFrame');
+const bulkHintText = bulkHint.textContent;
 
 let resultsData = [];
 
@@ -81,6 +85,18 @@ async function scrapeLinkedIn() {
         
         if (!response.ok) {
             const errorText = await response.text();
+            let errorData = null;
+            try {
+                errorData = JSON.parse(errorText);
+            } catch (parseErr) {
+                // Not JSON - fall through to the raw text
+            }
+            if (errorData && errorData.error) {
+                // 429/503 responses from admission control include a retry hint
+                const retryAfter = response.headers.get('Retry-After');
+                const retryHint = retryAfter ? ` (retry in ${retryAfter}s)` : '';
+                throw new Error(errorData.error + retryHint);
+            }
             throw new Error(`Server error (${response.status}): ${errorText}`);
         }
         
@@ -115,6 +131,37 @@ async function scrapeLinkedIn() {
     }
 }
 
+// Bulk mode: the form posts into a hidden iframe so the browser streams the
+// response straight into a download instead of holding results in memory
+let bulkPending = false;
+
+bulkForm.addEventListener('submit', () => {
+    hideError();
+    bulkPending = true;
+    bulkHint.textContent = 'Bulk scrape started. The download fills in as each company finishes - keep this tab open until it completes.';
+});
+
+// Successful downloads don't fire "load"; an error page (JSON) does
+bulkDownloadFrame.addEventListener('load', () => {
+    if (!bulkPending) {
+        return;
+    }
+    bulkPending = false;
+    bulkHint.textContent = bulkHintText;
+    
+    let message = 'Bulk scrape failed';
+    try {
+        const text = bulkDownloadFrame.contentDocument.body.textContent;
+        const data = JSON.parse(text);
+        if (data.error) {
+            message = data.error + (data.retry_after ? ` (retry in ${data.retry_after}s)` : '');
+        }
+    } catch (err) {
+        // Keep the generic message
+    }
+    showError(message);
+});
+
 // Display results in table
 function displayResults(results) {
     resultsTableBody.innerHTML = '';
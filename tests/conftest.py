@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Let tests import the app packages without installing them
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
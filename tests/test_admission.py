@@ -0,0 +1,90 @@
+import pytest
+
+import admission
+from admission import AdmissionPool
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(admission.time, 'monotonic', clock)
+    return clock
+
+
+def pool(**settings):
+    defaults = dict(name='test', rate=1.0, burst=2, max_in_flight=10)
+    defaults.update(settings)
+    return AdmissionPool(**defaults)
+
+
+@pytest.mark.parametrize('settings', [
+    dict(rate=0),
+    dict(rate=-1),
+    dict(burst=0),
+    dict(max_in_flight=0),
+    dict(max_in_flight_per_client=-1),
+])
+def test_invalid_settings_are_rejected(settings):
+    with pytest.raises(ValueError):
+        pool(**settings)
+
+
+def test_per_client_cap_of_zero_falls_back_to_global_cap():
+    assert pool(max_in_flight=4, max_in_flight_per_client=0).max_in_flight_per_client == 4
+
+
+def test_bucket_empties_and_refills(clock):
+    p = pool(rate=0.5, burst=2)
+    for _ in range(2):
+        assert p.acquire('a') == (True, None)
+        p.release('a')
+
+    admitted, (status, _, retry_after) = p.acquire('a')
+    assert not admitted and status == 429
+    assert retry_after == pytest.approx(2.0)
+
+    clock.now += 2.0
+    assert p.acquire('a') == (True, None)
+
+
+def test_busy_rejection_refunds_the_token(clock):
+    p = pool(burst=2, max_in_flight=1)
+    assert p.acquire('a') == (True, None)
+
+    admitted, (status, _, _) = p.acquire('b')
+    assert not admitted and status == 503
+    assert p.buckets['b'].tokens == pytest.approx(2.0)
+
+
+def test_per_client_cap(clock):
+    p = pool(burst=5, max_in_flight=3, max_in_flight_per_client=1)
+    assert p.acquire('a') == (True, None)
+    assert p.acquire('a')[1][0] == 503
+    assert p.acquire('b') == (True, None)
+
+    p.release('a')
+    assert p.acquire('a') == (True, None)
+    assert p.client_in_flight == {'a': 1, 'b': 1}
+
+
+def test_least_recently_seen_client_is_evicted(clock, monkeypatch):
+    monkeypatch.setattr(admission, 'MAX_TRACKED_CLIENTS', 3)
+    p = pool(burst=5)
+    for client in ('a', 'b', 'c'):
+        p.acquire(client)
+        p.release(client)
+    p.acquire('a')  # 'a' is now the most recently seen
+    p.release('a')
+
+    p.acquire('d')
+    p.release('d')
+    assert list(p.buckets) == ['c', 'a', 'd']
+    assert p.buckets['a'].tokens == pytest.approx(3.0)
@@ -0,0 +1,72 @@
+import io
+
+import pytest
+
+from analyst2.batch import clean_url, iter_input_urls
+
+URL = 'https://www.linkedin.com/company/acme'
+OTHER = 'https://www.linkedin.com/company/globex'
+
+
+def rows(text, fmt):
+    return list(iter_input_urls(io.BytesIO(text.encode('utf-8')), fmt))
+
+
+@pytest.mark.parametrize('url, expected', [
+    (URL, URL),
+    ('  linkedin.com/company/acme/  ', 'https://linkedin.com/company/acme/'),
+    ('http://uk.linkedin.com/company/acme', 'http://uk.linkedin.com/company/acme'),
+])
+def test_clean_url_accepts_company_urls(url, expected):
+    assert clean_url(url) == expected
+
+
+@pytest.mark.parametrize('url', [
+    None,
+    42,
+    '',
+    'https://www.linkedin.com/in/someone',
+    'https://www.linkedin.com/company/',
+    'https://evil.example/linkedin.com/company/acme',
+    'https://linkedin.com.evil.example/company/acme',
+    'ftp://www.linkedin.com/company/acme',
+    '{"note": "linkedin.com/company/acme"}',
+    'not json linkedin.com/company/acme',
+])
+def test_clean_url_rejects_everything_else(url):
+    assert clean_url(url) is None
+
+
+def test_csv_with_known_header():
+    assert rows(f'Name,URL\nAcme,{URL}\nGlobex,{OTHER}\n', 'csv') == [(URL, URL), (OTHER, OTHER)]
+
+
+def test_csv_without_header():
+    assert rows(f'Acme,{URL}\nGlobex,{OTHER}\n', 'csv') == [(URL, URL), (OTHER, OTHER)]
+
+
+def test_csv_with_unknown_header_picks_column_from_data():
+    assert rows(f'Company,Website\n\nAcme,{URL}\nGlobex,{OTHER}\n', 'csv') == [(URL, URL), (OTHER, OTHER)]
+
+
+def test_csv_rows_before_any_url_are_reported_invalid():
+    assert rows(f'Company,Website\nAcme,n/a\nGlobex,{OTHER}\n', 'csv') == [
+        ('Acme,n/a', None), (OTHER, OTHER)]
+
+
+def test_csv_short_row_yields_empty_cell():
+    assert rows(f'Name,URL\nAcme,{URL}\nGlobex\n', 'csv') == [(URL, URL), ('', '')]
+
+
+def test_ndjson_objects_and_strings():
+    text = f'{{"url": "{URL}"}}\n\n"{OTHER}"\n{{"company_url": "{URL}", "name": "Acme"}}\n'
+    assert [candidate for _, candidate in rows(text, 'ndjson')] == [URL, OTHER, URL]
+
+
+def test_ndjson_malformed_lines_are_rejected():
+    text = ('not json linkedin.com/company/acme\n'
+            '{"note": "linkedin.com/company/acme"}\n'
+            '{"url": 42}\n')
+    result = rows(text, 'ndjson')
+    assert [raw for raw, _ in result] == text.splitlines()
+    assert all(clean_url(candidate) is None for _, candidate in result)
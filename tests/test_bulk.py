@@ -0,0 +1,55 @@
+import io
+import types
+
+import pytest
+
+import analyst2
+
+URL = 'https://www.linkedin.com/company/acme'
+CSV = f'Company,Website\nAcme,{URL}\n'
+BULK = '/analyst2/scrape-linkedin/bulk'
+
+
+@pytest.fixture
+def client(monkeypatch):
+    fake = types.SimpleNamespace(
+        get_driver=lambda: None,
+        pause_between_urls=lambda: None,
+        scrape_url=lambda url, label: {'url': url, 'employee_count': '10', 'error': None},
+    )
+    monkeypatch.setattr(analyst2, 'get_scraper', lambda: fake)
+    from app import app
+    monkeypatch.setitem(app.config, 'ADMISSION_ENABLED', False)
+    return app.test_client()
+
+
+def test_raw_csv_body(client):
+    response = client.post(BULK, data=CSV, content_type='text/csv')
+    assert response.status_code == 200
+    assert response.get_data(as_text=True).splitlines() == [
+        'LinkedIn URL,Employee Count,Status', f'{URL},10,Success']
+
+
+def test_raw_body_reads_options_from_query_string(client):
+    response = client.post(BULK + '?output=ndjson', data=CSV, content_type='text/csv')
+    assert response.mimetype == 'application/x-ndjson'
+    assert response.get_data(as_text=True).count('\n') == 1
+
+
+def test_form_encoded_body_is_rejected(client):
+    # curl --data-binary @companies.csv sends this content type by default
+    response = client.post(BULK, data=CSV, content_type='application/x-www-form-urlencoded')
+    assert response.status_code == 415
+    assert 'text/csv' in response.get_json()['error']
+
+
+def test_multipart_upload(client):
+    response = client.post(BULK, data={'file': (io.BytesIO(CSV.encode()), 'companies.csv'), 'output': 'ndjson'},
+                           content_type='multipart/form-data')
+    assert response.status_code == 200
+    assert response.mimetype == 'application/x-ndjson'
+
+
+def test_missing_file(client):
+    assert client.post(BULK, data={}, content_type='multipart/form-data').status_code == 400
+    assert client.post(BULK, content_type='text/csv').status_code == 400